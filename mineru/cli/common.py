@@ -20,17 +20,22 @@ pdf_suffixes = [".pdf"]
 image_suffixes = [".png", ".jpeg", ".jpg", ".webp", ".gif"]
 
 
+def file_bytes_to_pdf_bytes(file_bytes, suffix):
+    # 后缀不区分大小写，如.PDF或.JPG | en: Suffixes are case-insensitive, e.g. .PDF or .JPG
+    if suffix.lower() in image_suffixes:
+        return images_bytes_to_pdf_bytes(file_bytes)
+    elif suffix.lower() in pdf_suffixes:
+        return file_bytes
+    else:
+        raise Exception(f"Unknown file suffix: {suffix}")
+
+
 def read_fn(path):
     if not isinstance(path, Path):
         path = Path(path)
     with open(str(path), "rb") as input_file:
         file_bytes = input_file.read()
-        if path.suffix in image_suffixes:
-            return images_bytes_to_pdf_bytes(file_bytes)
-        elif path.suffix in pdf_suffixes:
-            return file_bytes
-        else:
-            raise Exception(f"Unknown file suffix: {path.suffix}")
+        return file_bytes_to_pdf_bytes(file_bytes, path.suffix)
 
 
 def prepare_env(output_dir, pdf_file_name, parse_method):
@@ -103,7 +108,8 @@ def _process_output(
         is_pipeline=True
 ):
     from mineru.backend.pipeline.pipeline_middle_json_mkcontent import union_make as pipeline_union_make
-    """处理输出文件"""
+    """处理输出文件，并返回已导出结果的内容"""
+    artifacts = {}
     if f_draw_layout_bbox:
         draw_layout_bbox(pdf_info, pdf_bytes, local_md_dir, f"{pdf_file_name}_layout.pdf")
 
@@ -125,26 +131,32 @@ def _process_output(
             f"{pdf_file_name}.md",
             md_content_str,
         )
+        artifacts["md_content"] = md_content_str
 
     if f_dump_content_list:
         make_func = pipeline_union_make if is_pipeline else vlm_union_make
         content_list = make_func(pdf_info, MakeMode.CONTENT_LIST, image_dir)
+        content_list_str = json.dumps(content_list, ensure_ascii=False, indent=4)
         md_writer.write_string(
             f"{pdf_file_name}_content_list.json",
-            json.dumps(content_list, ensure_ascii=False, indent=4),
+            content_list_str,
         )
+        artifacts["content_list"] = content_list_str
 
     if f_dump_middle_json:
+        middle_json_str = json.dumps(middle_json, ensure_ascii=False, indent=4)
         md_writer.write_string(
             f"{pdf_file_name}_middle.json",
-            json.dumps(middle_json, ensure_ascii=False, indent=4),
+            middle_json_str,
         )
+        artifacts["middle_json"] = middle_json_str
 
     if f_dump_model_output:
         if is_pipeline:
+            output_text = json.dumps(model_output, ensure_ascii=False, indent=4)
             md_writer.write_string(
                 f"{pdf_file_name}_model.json",
-                json.dumps(model_output, ensure_ascii=False, indent=4),
+                output_text,
             )
         else:
             output_text = ("\n" + "-" * 50 + "\n").join(model_output)
@@ -152,8 +164,10 @@ def _process_output(
                 f"{pdf_file_name}_model_output.txt",
                 output_text,
             )
+        artifacts["model_output"] = output_text
 
     logger.info(f"local output dir is {local_md_dir}")
+    return artifacts
 
 
 def _process_pipeline(
@@ -173,7 +187,7 @@ def _process_pipeline(
         f_dump_content_list,
         f_make_md_mode,
 ):
-    """处理pipeline后端逻辑"""
+    """处理pipeline后端逻辑，返回按文件名索引的导出结果"""
     from mineru.backend.pipeline.model_json_to_middle_json import result_to_middle_json as pipeline_result_to_middle_json
     from mineru.backend.pipeline.pipeline_analyze import doc_analyze as pipeline_doc_analyze
 
@@ -184,6 +198,7 @@ def _process_pipeline(
         )
     )
 
+    results = {}
     for idx, model_list in enumerate(infer_results):
         model_json = copy.deepcopy(model_list)
         pdf_file_name = pdf_file_names[idx]
@@ -203,12 +218,13 @@ def _process_pipeline(
         pdf_info = middle_json["pdf_info"]
         pdf_bytes = pdf_bytes_list[idx]
 
-        _process_output(
+        results[pdf_file_name] = _process_output(
             pdf_info, pdf_bytes, pdf_file_name, local_md_dir, local_image_dir,
             md_writer, f_draw_layout_bbox, f_draw_span_bbox, f_dump_orig_pdf,
             f_dump_md, f_dump_content_list, f_dump_middle_json, f_dump_model_output,
             f_make_md_mode, middle_json, model_json, is_pipeline=True
         )
+    return results
 
 
 async def _async_process_vlm(
@@ -227,12 +243,13 @@ async def _async_process_vlm(
         server_url=None,
         **kwargs,
 ):
-    """异步处理VLM后端逻辑"""
+    """异步处理VLM后端逻辑，返回按文件名索引的导出结果"""
     parse_method = "vlm"
     f_draw_span_bbox = False
     if not backend.endswith("client"):
         server_url = None
 
+    results = {}
     for idx, pdf_bytes in enumerate(pdf_bytes_list):
         pdf_file_name = pdf_file_names[idx]
         local_image_dir, local_md_dir = prepare_env(output_dir, pdf_file_name, parse_method)
@@ -244,12 +261,13 @@ async def _async_process_vlm(
 
         pdf_info = middle_json["pdf_info"]
 
-        _process_output(
+        results[pdf_file_name] = _process_output(
             pdf_info, pdf_bytes, pdf_file_name, local_md_dir, local_image_dir,
             md_writer, f_draw_layout_bbox, f_draw_span_bbox, f_dump_orig_pdf,
             f_dump_md, f_dump_content_list, f_dump_middle_json, f_dump_model_output,
             f_make_md_mode, middle_json, infer_result, is_pipeline=False
         )
+    return results
 
 
 def _process_vlm(
@@ -268,12 +286,13 @@ def _process_vlm(
         server_url=None,
         **kwargs,
 ):
-    """同步处理VLM后端逻辑"""
+    """同步处理VLM后端逻辑，返回按文件名索引的导出结果"""
     parse_method = "vlm"
     f_draw_span_bbox = False
     if not backend.endswith("client"):
         server_url = None
 
+    results = {}
     for idx, pdf_bytes in enumerate(pdf_bytes_list):
         pdf_file_name = pdf_file_names[idx]
         local_image_dir, local_md_dir = prepare_env(output_dir, pdf_file_name, parse_method)
@@ -285,12 +304,13 @@ def _process_vlm(
 
         pdf_info = middle_json["pdf_info"]
 
-        _process_output(
+        results[pdf_file_name] = _process_output(
             pdf_info, pdf_bytes, pdf_file_name, local_md_dir, local_image_dir,
             md_writer, f_draw_layout_bbox, f_draw_span_bbox, f_dump_orig_pdf,
             f_dump_md, f_dump_content_list, f_dump_middle_json, f_dump_model_output,
             f_make_md_mode, middle_json, infer_result, is_pipeline=False
         )
+    return results
 
 
 def do_parse(
@@ -319,7 +339,7 @@ def do_parse(
     pdf_bytes_list = _prepare_pdf_bytes(pdf_bytes_list, start_page_id, end_page_id)
 
     if backend == "pipeline":
-        _process_pipeline(
+        return _process_pipeline(
             output_dir, pdf_file_names, pdf_bytes_list, p_lang_list,
             parse_method, formula_enable, table_enable,
             f_draw_layout_bbox, f_draw_span_bbox, f_dump_md, f_dump_middle_json,
@@ -332,7 +352,7 @@ def do_parse(
         os.environ['MINERU_VLM_FORMULA_ENABLE'] = str(formula_enable)
         os.environ['MINERU_VLM_TABLE_ENABLE'] = str(table_enable)
 
-        _process_vlm(
+        return _process_vlm(
             output_dir, pdf_file_names, pdf_bytes_list, backend,
             f_draw_layout_bbox, f_draw_span_bbox, f_dump_md, f_dump_middle_json,
             f_dump_model_output, f_dump_orig_pdf, f_dump_content_list, f_make_md_mode,
@@ -367,7 +387,7 @@ async def aio_do_parse(
 
     if backend == "pipeline":
         # pipeline模式暂不支持异步，使用同步处理方式
-        _process_pipeline(
+        return _process_pipeline(
             output_dir, pdf_file_names, pdf_bytes_list, p_lang_list,
             parse_method, formula_enable, table_enable,
             f_draw_layout_bbox, f_draw_span_bbox, f_dump_md, f_dump_middle_json,
@@ -380,7 +400,7 @@ async def aio_do_parse(
         os.environ['MINERU_VLM_FORMULA_ENABLE'] = str(formula_enable)
         os.environ['MINERU_VLM_TABLE_ENABLE'] = str(table_enable)
 
-        await _async_process_vlm(
+        return await _async_process_vlm(
             output_dir, pdf_file_names, pdf_bytes_list, backend,
             f_draw_layout_bbox, f_draw_span_bbox, f_dump_md, f_dump_middle_json,
             f_dump_model_output, f_dump_orig_pdf, f_dump_content_list, f_make_md_mode,
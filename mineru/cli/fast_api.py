@@ -1,77 +1,318 @@
+import asyncio
+import gzip
+import json
+import multiprocessing
 import uuid
 import os
+import sys
+import tempfile
+import aiofiles
+import aiofiles.os
+import anyio.to_thread
 import uvicorn
 import click
+import orjson
+import pybase64
 import sentry_sdk
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from glob import glob
-from fastapi import FastAPI, UploadFile, File, Form
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
-from typing import List, Optional
+from fastapi import FastAPI, UploadFile, File, Form, Request
+from fastapi.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Any, List, Optional, Tuple
 from loguru import logger
-from base64 import b64encode
 
-from mineru.cli.common import aio_do_parse, read_fn, pdf_suffixes, image_suffixes
+from mineru.cli.common import aio_do_parse, do_parse, file_bytes_to_pdf_bytes, pdf_suffixes, image_suffixes
 from mineru.utils.cli_parser import arg_parse
 from mineru.version import __version__
 
+# 允许上传的文件后缀 | en: File suffixes accepted for upload
+_ALLOWED_SUFFIXES = frozenset(suffix.lower() for suffix in (*pdf_suffixes, *image_suffixes))
+# 同时处理的上传文件数量上限 | en: Maximum number of uploads ingested concurrently
+INGEST_CONCURRENCY = 4
+# pipeline解析进程数量，每个进程独立加载模型 | en: Number of pipeline parse processes; each one loads its own copy of the models
+PARSE_WORKERS = int(os.getenv("MINERU_PARSE_WORKERS", "1"))
+# 工作线程数量与同时解析的请求数量上限 | en: Worker thread count and maximum number of in-flight parse requests
+THREAD_LIMIT = int(os.getenv("MINERU_THREADS", "8"))
+INFLIGHT_LIMIT = int(os.getenv("MINERU_INFLIGHT", "4"))
+# 单个上传文件与整个请求体的大小上限（字节），0表示不限制
+# en: Size limits in bytes for a single uploaded file and for the whole request body, 0 disables the check
+MAX_UPLOAD_SIZE = int(os.getenv("MINERU_MAX_UPLOAD_SIZE", "0"))
+MAX_REQUEST_SIZE = int(os.getenv("MINERU_MAX_REQUEST_SIZE", "0"))
+# 上传文件溢写目录，默认为空即使用系统临时目录；可设为/dev/shm等tmpfs，注意其占用内存且Docker默认仅64MB
+# en: Spill directory for uploads; empty (the default) keeps the system temp dir. Can point at a tmpfs such as
+# /dev/shm, which is backed by RAM and only 64 MB by default in Docker
+UPLOAD_TMPDIR = os.getenv("MINERU_UPLOAD_TMPDIR", "")
+
+# 健康检查响应体只需序列化一次 | en: The health check body only needs to be serialized once
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "mineru-api", "version": __version__})
+
+
+
+def _create_executor() -> ProcessPoolExecutor:
+    """创建解析进程池 | en: Create the parse process pool"""
+    # 进程在首次提交任务时才会启动；使用spawn以避免fork多线程进程
+    # en: Processes start on first submit; spawn avoids forking a multi-threaded server process
+    return ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+
+EXECUTOR = _create_executor()
+INFLIGHT = asyncio.Semaphore(INFLIGHT_LIMIT)
+
 # Initialize Sentry SDK before creating FastAPI app (only if DSN is provided)
 sentry_dsn = os.getenv("SENTRY_DSN")
+sentry_environment = os.getenv("SENTRY_ENVIRONMENT", "development")
+# Development defaults (full tracing/profiling, PII, the debug route) require SENTRY_ENVIRONMENT to be set
+# explicitly; an unset variable gets the sparse production defaults
+is_development = os.getenv("SENTRY_ENVIRONMENT") == "development"
+sentry_traces_sample_rate = float(os.getenv(
+    "SENTRY_TRACES_SAMPLE_RATE", "1.0" if is_development else "0.05"
+))
+sentry_profile_sample_rate = float(os.getenv(
+    "SENTRY_PROFILE_SAMPLE_RATE", "1.0" if is_development else "0.0"
+))
+# Health probes and the debug route are hit often and carry no useful trace data
+_UNTRACED_PATHS = ("/health", "/sentry-debug")
+
+
+def _traces_sampler(sampling_context: dict) -> float:
+    """Sentry traces sampler that skips probe endpoints and follows upstream sampling decisions"""
+    name = sampling_context.get("transaction_context", {}).get("name") or ""
+    if name.endswith(_UNTRACED_PATHS):
+        return 0.0
+    # Keep distributed traces intact by inheriting the caller's decision
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+    return sentry_traces_sample_rate
+
+
 if sentry_dsn:
     sentry_sdk.init(
         dsn=sentry_dsn,
         # Add data like request headers and IP for users,
         # see https://docs.sentry.io/platforms/python/data-management/data-collected/ for more info
-        send_default_pii=True,
-        # Set traces_sample_rate to 1.0 to capture 100%
-        # of transactions for tracing.
-        traces_sample_rate=1.0,
-        # Set profile_session_sample_rate to 1.0 to profile 100%
-        # of profile sessions.
-        profile_session_sample_rate=1.0,
-        # Set profile_lifecycle to "trace" to automatically
-        # run the profiler on when there is an active transaction
-        profile_lifecycle="trace",
-        environment=os.getenv("SENTRY_ENVIRONMENT", "development"),
+        send_default_pii=os.getenv(
+            "SENTRY_SEND_DEFAULT_PII", str(is_development)
+        ).lower() in ["true", "1", "yes"],
+        # Fraction of transactions captured for tracing; probe endpoints are never traced
+        traces_sampler=_traces_sampler,
+        # Fraction of profile sessions that are profiled
+        profile_session_sample_rate=sentry_profile_sample_rate,
+        # Run the profiler automatically while a transaction is active whenever profiling is enabled
+        profile_lifecycle="trace" if sentry_profile_sample_rate > 0 else "manual",
+        environment=sentry_environment,
     )
 
+class OrjsonResponse(Response):
+    """使用orjson序列化的JSON响应 | en: JSON response serialized with orjson
+
+    FastAPI自带的ORJSONResponse已弃用并会在每次使用时发出警告 | en: FastAPI's own ORJSONResponse is deprecated and warns on every use
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+class SelectiveGZipMiddleware:
+    """gzip压缩响应，跳过端点通过request.state.skip_gzip标记的响应
+    en: Gzip responses, except those whose endpoint set request.state.skip_gzip
+
+    响应体会完整缓冲后再压缩，本服务没有流式响应 | en: Bodies are buffered before compressing; this service has no streaming responses
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, compresslevel: int = 9):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        body_parts: List[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            headers = MutableHeaders(raw=start_message["headers"])
+            skip_gzip = scope.get("state", {}).get("skip_gzip", False)
+            if len(body) >= self.minimum_size and "content-encoding" not in headers and not skip_gzip:
+                body = await asyncio.to_thread(gzip.compress, body, self.compresslevel)
+                headers["Content-Encoding"] = "gzip"
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class MaxRequestSizeMiddleware:
+    """按Content-Length在接收请求体前拒绝超限请求 | en: Reject requests by Content-Length before the body is received
+
+    未声明Content-Length的请求（如分块传输）不受此检查 | en: Requests without Content-Length (e.g. chunked) are not checked here
+    """
+
+    def __init__(self, app: ASGIApp, max_size: int):
+        self.app = app
+        self.max_size = max_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            content_length = Headers(scope=scope).get("content-length", "")
+            if content_length.isdigit() and int(content_length) > self.max_size:
+                response = OrjsonResponse(
+                    status_code=413,
+                    content={"error": f"Request body exceeds {self.max_size} bytes"}
+                )
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+def configure_thread_limits():
+    """限制工作线程数量 | en: Cap the number of worker threads"""
+    # anyio线程池用于Starlette的同步调用，默认执行器用于asyncio.to_thread和aiofiles
+    # en: anyio's pool serves Starlette's sync calls; the default executor serves asyncio.to_thread and aiofiles
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREAD_LIMIT
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=THREAD_LIMIT))
+
+
+def configure_upload_tmpdir():
+    """按配置修改上传文件的溢写目录 | en: Move the upload spill directory when configured"""
+    # Starlette将超过内存阈值的上传写入tempfile默认目录的SpooledTemporaryFile；该设置对整个进程生效
+    # en: Starlette spools large uploads into SpooledTemporaryFile under tempfile's default directory; this is process-wide
+    if not UPLOAD_TMPDIR:
+        return
+    if not os.path.isdir(UPLOAD_TMPDIR):
+        logger.warning(f"MINERU_UPLOAD_TMPDIR {UPLOAD_TMPDIR} is not a directory, keeping the system temp dir")
+        return
+    tempfile.tempdir = UPLOAD_TMPDIR
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """服务启动时配置线程与临时目录，退出时关闭解析进程池
+    en: Configure threads and the temp dir on startup, shut down the parse process pool on exit
+    """
+    configure_thread_limits()
+    configure_upload_tmpdir()
+    yield
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
     title="MinerU API",
     description="PDF to Markdown conversion API with ML models",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=OrjsonResponse,
+    lifespan=lifespan,
 )
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1000)
+if MAX_REQUEST_SIZE:
+    app.add_middleware(MaxRequestSizeMiddleware, max_size=MAX_REQUEST_SIZE)
+# 多进程模式下工作进程重新导入本模块，通过环境变量继承命令行配置
+# en: Worker processes re-import this module, so CLI config is inherited via the environment
+app.state.config = json.loads(os.getenv("MINERU_API_CONFIG", "{}"))
 
-# Add Sentry debug endpoint for verification
-@app.get("/sentry-debug")
-async def trigger_error():
-    """Endpoint to test Sentry error tracking"""
-    division_by_zero = 1 / 0
 
-# Add health check endpoint
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for monitoring"""
-    return {"status": "healthy", "service": "mineru-api", "version": __version__}
+async def encode_image(image_path: str) -> str:
+    """Encode image as a base64 data URI"""
+    async with aiofiles.open(image_path, "rb") as f:
+        return "data:image/jpeg;base64," + pybase64.b64encode_as_string(await f.read())
 
-def encode_image(image_path: str) -> str:
-    """Encode image using base64"""
-    with open(image_path, "rb") as f:
-        return b64encode(f.read()).decode()
 
-
-def get_infer_result(file_suffix_identifier: str, pdf_name: str, parse_dir: str) -> Optional[str]:
+async def get_infer_result(file_suffix_identifier: str, pdf_name: str, parse_dir: str) -> Optional[str]:
     """从结果文件中读取推理结果 | en: Read inference results from the result file"""
     result_file_path = os.path.join(parse_dir, f"{pdf_name}{file_suffix_identifier}")
-    if os.path.exists(result_file_path):
-        with open(result_file_path, "r", encoding="utf-8") as fp:
-            return fp.read()
-    return None
+    try:
+        async with aiofiles.open(result_file_path, "r", encoding="utf-8") as fp:
+            return await fp.read()
+    except FileNotFoundError:
+        return None
+
+
+async def _get_artifact(artifacts: dict, key: str, file_suffix_identifier: str, pdf_name: str, parse_dir: str) -> Optional[str]:
+    """优先使用解析返回的内存结果，缺失时读取结果文件 | en: Prefer the in-memory parse result, falling back to the result file"""
+    content = artifacts.get(key)
+    if content is None:
+        content = await get_infer_result(file_suffix_identifier, pdf_name, parse_dir)
+    return content
+
+
+def _list_images(parse_dir: str) -> List[str]:
+    """列出解析目录下的图片 | en: List the images of a parse directory"""
+    try:
+        with os.scandir(os.path.join(parse_dir, "images")) as it:
+            return [entry.path for entry in it if entry.is_file() and entry.name.endswith(".jpg")]
+    except FileNotFoundError:
+        return []
+
+
+async def _run_in_parse_pool(func):
+    """在解析进程池中执行任务，进程池损坏时重建 | en: Run a task in the parse process pool, rebuilding the pool once it breaks"""
+    global EXECUTOR
+    executor = EXECUTOR
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, func)
+    except BrokenProcessPool:
+        # 解析进程异常退出（如OOM）后进程池不可再用，重建以免后续请求全部失败
+        # en: A crashed parse process (e.g. OOM-killed) breaks the pool for good; rebuild it so later requests still work
+        if EXECUTOR is executor:
+            logger.error("Parse process pool is broken, recreating it")
+            EXECUTOR = _create_executor()
+            executor.shutdown(wait=False, cancel_futures=True)
+        raise
+
+
+async def _ingest(file: UploadFile) -> Tuple[str, bytes]:
+    """读取上传文件并转换为PDF字节 | en: Read an upload and convert it to PDF bytes"""
+    file_path = Path(file.filename)
+
+    if file_path.suffix.lower() not in _ALLOWED_SUFFIXES:
+        raise ValueError(f"Unsupported file type: {file_path.suffix}")
+
+    content = await file.read()
+    try:
+        # 在线程中执行阻塞的转换，避免阻塞事件循环 | en: Run the blocking conversion in a thread to keep the event loop free
+        pdf_bytes = await asyncio.to_thread(file_bytes_to_pdf_bytes, content, file_path.suffix)
+    except Exception as e:
+        raise ValueError(f"Failed to load file: {str(e)}") from e
+    return file_path.stem, pdf_bytes
+
+
+async def _ingest_guard(sem: asyncio.Semaphore, file: UploadFile) -> Tuple[str, bytes]:
+    """限制同时处理的上传文件数量 | en: Bound the number of uploads ingested at the same time"""
+    async with sem:
+        return await _ingest(file)
 
 
 @app.post(path="/file_parse",)
 async def parse_pdf(
+        request: Request,
         files: List[UploadFile] = File(...),
         output_dir: str = Form("./output"),
         lang_list: List[str] = Form(["ch"]),
@@ -92,134 +333,169 @@ async def parse_pdf(
     # 获取命令行配置参数 | en: Get command line configuration parameters
     config = getattr(app.state, "config", {})
 
-    try:
-        # Add Sentry context for better error tracking and debugging
-        with sentry_sdk.configure_scope() as scope:
-            scope.set_tag("backend", backend)
-            scope.set_tag("parse_method", parse_method)
-            scope.set_context("files", {
-                "count": len(files),
-                "names": [f.filename for f in files]
-            })
-            scope.set_context("config", {
+    # 并发解析请求已满时直接拒绝，而不是排队等待 | en: Reject rather than queue when all parse slots are busy
+    if INFLIGHT.locked():
+        return OrjsonResponse(
+            status_code=429,
+            content={"error": "Too many concurrent requests, please retry later"}
+        )
+
+    async with INFLIGHT:
+        try:
+            # Add Sentry context for better error tracking and debugging
+            sentry_sdk.set_tag("backend", backend)
+            sentry_sdk.set_tag("parse_method", parse_method)
+            sentry_sdk.set_context("config", {
                 "lang_list": lang_list,
                 "formula_enable": formula_enable,
                 "table_enable": table_enable,
             })
 
-        # 创建唯一的输出目录 | en: Create a unique output directory
-        unique_dir = os.path.join(output_dir, str(uuid.uuid4()))
-        os.makedirs(unique_dir, exist_ok=True)
-
-        # 处理上传的PDF文件 | en: Process uploaded PDF files
-        pdf_file_names = []
-        pdf_bytes_list = []
-
-        for file in files:
-            content = await file.read()
-            file_path = Path(file.filename)
+            # 并发处理上传的PDF文件 | en: Process uploaded PDF files concurrently
+            sem = asyncio.Semaphore(INGEST_CONCURRENCY)
+            filenames = []
+            tasks = []
+            for file in files:
+                # 此时请求体已被接收并溢写，此检查仅避免转换与解析超限文件
+                # en: The body has already been received and spooled; this only skips converting and parsing oversized files
+                if MAX_UPLOAD_SIZE and file.size and file.size > MAX_UPLOAD_SIZE:
+                    # 关闭已创建但未调度的协程 | en: Close the coroutines created so far, they were never scheduled
+                    for task in tasks:
+                        task.close()
+                    return OrjsonResponse(
+                        status_code=413,
+                        content={"error": f"File too large: {file.filename} exceeds {MAX_UPLOAD_SIZE} bytes"}
+                    )
+                filenames.append(file.filename)
+                tasks.append(_ingest_guard(sem, file))
+            sentry_sdk.set_context("files", {"count": len(filenames), "names": filenames})
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            if file_path.suffix.lower() not in pdf_suffixes + image_suffixes:
-                return JSONResponse(
-                    status_code=400,
-                    content={"error": f"Unsupported file type: {file_path.suffix}"}
-                )
+            pdf_file_names = []
+            pdf_bytes_list = []
+            for result in results:
+                if isinstance(result, ValueError):
+                    return OrjsonResponse(
+                        status_code=400,
+                        content={"error": str(result)}
+                    )
+                if isinstance(result, BaseException):
+                    raise result
+                pdf_file_name, pdf_bytes = result
+                pdf_file_names.append(pdf_file_name)
+                pdf_bytes_list.append(pdf_bytes)
 
+            # 创建唯一的输出目录 | en: Create a unique output directory
+            unique_dir = os.path.join(output_dir, str(uuid.uuid4()))
+            os.makedirs(unique_dir, exist_ok=True)
 
-            # 创建临时文件以便使用read_fn | en: Create a temporary file for read_fn
-            temp_path = Path(unique_dir) / file_path.name
-            with open(temp_path, "wb") as f:
-                f.write(content)
+            # 设置语言列表，确保与文件数量一致 | en: Set language list to match the number of files
+            actual_lang_list = lang_list
+            if len(actual_lang_list) != len(pdf_file_names):
+                # 如果语言列表长度不匹配，使用第一个语言或默认"ch" | en: If the language list length does not match, use the first language or default to "ch"
+                actual_lang_list = [actual_lang_list[0] if actual_lang_list else "ch"] * len(pdf_file_names)
 
-            try:
-                pdf_bytes = read_fn(temp_path)
-                pdf_bytes_list.append(pdf_bytes)
-                pdf_file_names.append(file_path.stem)
-                os.remove(temp_path)  # 删除临时文件 | en: Remove temporary file after reading
-            except Exception as e:
-                return JSONResponse(
-                    status_code=400,
-                    content={"error": f"Failed to load file: {str(e)}"}
+            # 未请求任何结果时无需解析 | en: Skip parsing entirely when no result was requested
+            parse_results = {}
+            if return_md or return_middle_json or return_model_output or return_content_list or return_images:
+                parse_kwargs = dict(
+                    output_dir=unique_dir,
+                    pdf_file_names=pdf_file_names,
+                    pdf_bytes_list=pdf_bytes_list,
+                    p_lang_list=actual_lang_list,
+                    backend=backend,
+                    parse_method=parse_method,
+                    formula_enable=formula_enable,
+                    table_enable=table_enable,
+                    server_url=server_url,
+                    f_draw_layout_bbox=False,
+                    f_draw_span_bbox=False,
+                    f_dump_md=return_md,
+                    f_dump_middle_json=return_middle_json,
+                    f_dump_model_output=return_model_output,
+                    f_dump_orig_pdf=False,
+                    f_dump_content_list=return_content_list,
+                    start_page_id=start_page_id,
+                    end_page_id=end_page_id,
+                    **config
                 )
-        # 设置语言列表，确保与文件数量一致 | en: Set language list to match the number of files
-        actual_lang_list = lang_list
-        if len(actual_lang_list) != len(pdf_file_names):
-            # 如果语言列表长度不匹配，使用第一个语言或默认"ch" | en: If the language list length does not match, use the first language or default to "ch"
-            actual_lang_list = [actual_lang_list[0] if actual_lang_list else "ch"] * len(pdf_file_names)
-
-        # 调用异步处理函数 | en: Call the asynchronous processing function
-        await aio_do_parse(
-            output_dir=unique_dir,
-            pdf_file_names=pdf_file_names,
-            pdf_bytes_list=pdf_bytes_list,
-            p_lang_list=actual_lang_list,
-            backend=backend,
-            parse_method=parse_method,
-            formula_enable=formula_enable,
-            table_enable=table_enable,
-            server_url=server_url,
-            f_draw_layout_bbox=False,
-            f_draw_span_bbox=False,
-            f_dump_md=return_md,
-            f_dump_middle_json=return_middle_json,
-            f_dump_model_output=return_model_output,
-            f_dump_orig_pdf=False,
-            f_dump_content_list=return_content_list,
-            start_page_id=start_page_id,
-            end_page_id=end_page_id,
-            **config
-        )
+                if backend == "pipeline":
+                    # 在进程池中执行CPU密集的pipeline解析，保持事件循环响应
+                    # en: Run the CPU-bound pipeline parse in the process pool so the event loop stays responsive
+                    parse_results = await _run_in_parse_pool(partial(do_parse, **parse_kwargs))
+                else:
+                    # vlm后端本身是异步的，推理在引擎或远程服务中进行 | en: VLM backends are async; inference runs in the engine or a remote server
+                    parse_results = await aio_do_parse(**parse_kwargs)
 
-        # ch:构建结果路径 | en: Build result paths
-        result_dict = {}
-        for pdf_name in pdf_file_names:
-            result_dict[pdf_name] = {}
-            data = result_dict[pdf_name]
+            # ch:构建结果路径 | en: Build result paths
+            is_pipeline = backend.startswith("pipeline")
+            subdir = parse_method if is_pipeline else "vlm"
+            model_suffix = "_model.json" if is_pipeline else "_model_output.txt"
 
-            if backend.startswith("pipeline"):
-                parse_dir = os.path.join(unique_dir, pdf_name, parse_method)
-            else:
-                parse_dir = os.path.join(unique_dir, pdf_name, "vlm")
+            async def _collect(pdf_name: str) -> dict:
+                data = {}
+                parse_dir = os.path.join(unique_dir, pdf_name, subdir)
+                if not await aiofiles.os.path.exists(parse_dir):
+                    return data
 
-            if os.path.exists(parse_dir):
+                artifacts = parse_results.get(pdf_name, {})
                 if return_md:
-                    data["md_content"] = get_infer_result(".md", pdf_name, parse_dir)
+                    data["md_content"] = await _get_artifact(artifacts, "md_content", ".md", pdf_name, parse_dir)
                 if return_middle_json:
-                    data["middle_json"] = get_infer_result("_middle.json", pdf_name, parse_dir)
+                    data["middle_json"] = await _get_artifact(artifacts, "middle_json", "_middle.json", pdf_name, parse_dir)
                 if return_model_output:
-                    if backend.startswith("pipeline"):
-                        data["model_output"] = get_infer_result("_model.json", pdf_name, parse_dir)
-                    else:
-                        data["model_output"] = get_infer_result("_model_output.txt", pdf_name, parse_dir)
+                    data["model_output"] = await _get_artifact(artifacts, "model_output", model_suffix, pdf_name, parse_dir)
                 if return_content_list:
-                    data["content_list"] = get_infer_result("_content_list.json", pdf_name, parse_dir)
+                    data["content_list"] = await _get_artifact(artifacts, "content_list", "_content_list.json", pdf_name, parse_dir)
                 if return_images:
-                    image_paths = glob(f"{parse_dir}/images/*.jpg")
+                    # 在线程中列出目录，避免阻塞事件循环 | en: List the directory in a thread to keep the event loop free
+                    image_paths = await asyncio.to_thread(_list_images, parse_dir)
+                    encoded_images = await asyncio.gather(
+                        *(encode_image(image_path) for image_path in image_paths)
+                    )
                     data["images"] = {
-                        os.path.basename(
-                            image_path
-                        ): f"data:image/jpeg;base64,{encode_image(image_path)}"
-                        for image_path in image_paths
+                        os.path.basename(image_path): encoded_image
+                        for image_path, encoded_image in zip(image_paths, encoded_images)
                     }
-        return JSONResponse(
-            status_code=200,
-            content={
-                "backend": backend,
-                "version": __version__,
-                "results": result_dict
-            }
-        )
-    except Exception as e:
-        # Sentry will automatically capture this exception
-        sentry_sdk.capture_exception(e)
-        logger.exception(e)
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": f"Failed to process file: {str(e)}",
-                "request_id": str(uuid.uuid4())
-            }
-        )
+                return data
+
+            result_dict = {pdf_name: await _collect(pdf_name) for pdf_name in pdf_file_names}
+            # base64编码的JPEG几乎无法再压缩，跳过gzip | en: base64 JPEGs barely compress, so skip gzip for them
+            request.state.skip_gzip = return_images
+            return OrjsonResponse(
+                status_code=200,
+                content={
+                    "backend": backend,
+                    "version": __version__,
+                    "results": result_dict
+                }
+            )
+        except Exception as e:
+            # Sentry will automatically capture this exception
+            sentry_sdk.capture_exception(e)
+            logger.exception(e)
+            return OrjsonResponse(
+                status_code=500,
+                content={
+                    "error": f"Failed to process file: {str(e)}",
+                    "request_id": str(uuid.uuid4())
+                }
+            )
+
+
+# Add health check endpoint
+@app.get("/health")
+async def health_check():
+    """Health check endpoint for monitoring"""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Add Sentry debug endpoint for verification (explicit development environment only)
+if is_development:
+    @app.get("/sentry-debug")
+    async def trigger_error():
+        """Endpoint to test Sentry error tracking"""
+        division_by_zero = 1 / 0
 
 
 @click.command(context_settings=dict(ignore_unknown_options=True, allow_extra_args=True))
@@ -227,26 +503,38 @@ async def parse_pdf(
 @click.option('--host', default='127.0.0.1', help='Server host (default: 127.0.0.1)')
 @click.option('--port', default=8000, type=int, help='Server port (default: 8000)')
 @click.option('--reload', is_flag=True, help='Enable auto-reload (development mode)')
-def main(ctx, host, port, reload, **kwargs):
+@click.option('--workers', default=1, type=int, help='Number of worker processes, ignored with --reload (default: 1)')
+def main(ctx, host, port, reload, workers, **kwargs):
 
     kwargs |= arg_parse(ctx)
 
     # 将配置参数存储到应用状态中
     app.state.config = kwargs
+    os.environ["MINERU_API_CONFIG"] = json.dumps(kwargs)
 
     """启动MinerU FastAPI服务器的命令行入口"""
     print(f"Start MinerU FastAPI Service: http://{host}:{port}")
     print("The API documentation can be accessed at the following address:")
     print(f"- Swagger UI: http://{host}:{port}/docs")
     print(f"- ReDoc: http://{host}:{port}/redoc")
-    print(f"- Sentry Debug: http://{host}:{port}/sentry-debug")
+    if is_development:
+        print(f"- Sentry Debug: http://{host}:{port}/sentry-debug")
     print(f"- Health Check: http://{host}:{port}/health")
 
+    server_options = {"http": "httptools"}
+    # uvloop 不支持 Windows | en: uvloop is not available on Windows
+    if sys.platform != "win32":
+        server_options["loop"] = "uvloop"
+    # 多进程与自动重载互斥 | en: Multiple workers cannot be combined with auto-reload
+    if not reload:
+        server_options["workers"] = workers
+
     uvicorn.run(
         "mineru.cli.fast_api:app",
         host=host,
         port=port,
-        reload=reload
+        reload=reload,
+        **server_options
     )
 
 
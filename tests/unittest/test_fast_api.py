@@ -0,0 +1,140 @@
+# Copyright (c) Opendatalab. All rights reserved.
+import asyncio
+import os
+import tempfile
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from mineru.cli import fast_api
+from mineru.cli.fast_api import MaxRequestSizeMiddleware, SelectiveGZipMiddleware
+
+_PDF_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pdfs", "test.pdf")
+
+
+def _gzip_app():
+    gzip_app = FastAPI()
+    gzip_app.add_middleware(SelectiveGZipMiddleware, minimum_size=100)
+
+    @gzip_app.get("/payload")
+    async def payload(request: Request, skip: bool = False):
+        request.state.skip_gzip = skip
+        return {"data": "x" * 1000}
+
+    return gzip_app
+
+
+def test_gzip_compresses_large_responses():
+    client = TestClient(_gzip_app())
+    response = client.get("/payload")
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"data": "x" * 1000}
+
+
+def test_gzip_skipped_when_endpoint_opts_out():
+    client = TestClient(_gzip_app())
+    response = client.get("/payload", params={"skip": True})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.json() == {"data": "x" * 1000}
+
+
+def test_gzip_skipped_without_accept_encoding():
+    client = TestClient(_gzip_app())
+    response = client.get("/payload", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+
+
+class _BrokenExecutor(Executor):
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_exception(BrokenProcessPool("A child process terminated abruptly"))
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_lifespan_configures_and_shuts_down(monkeypatch, tmp_path):
+    executor = _BrokenExecutor()
+    monkeypatch.setattr(fast_api, "EXECUTOR", executor)
+    monkeypatch.setattr(fast_api, "UPLOAD_TMPDIR", str(tmp_path))
+    monkeypatch.setattr(tempfile, "tempdir", tempfile.tempdir)
+    with TestClient(fast_api.app) as client:
+        assert client.get("/health").status_code == 200
+        assert tempfile.tempdir == str(tmp_path)
+    assert executor.shut_down
+
+
+def test_broken_parse_pool_is_rebuilt(monkeypatch, tmp_path):
+    broken = _BrokenExecutor()
+    monkeypatch.setattr(fast_api, "EXECUTOR", broken)
+    client = TestClient(fast_api.app)
+    with open(_PDF_PATH, "rb") as f:
+        response = client.post(
+            "/file_parse",
+            files={"files": ("test.pdf", f, "application/pdf")},
+            data={"backend": "pipeline", "output_dir": str(tmp_path)},
+        )
+    assert response.status_code == 500
+    assert broken.shut_down
+    assert fast_api.EXECUTOR is not broken
+    fast_api.EXECUTOR.shutdown()
+
+
+def test_traces_sampler_follows_parent_decision():
+    context = {"transaction_context": {"name": "/file_parse"}}
+    assert fast_api._traces_sampler({**context, "parent_sampled": True}) == 1.0
+    assert fast_api._traces_sampler({**context, "parent_sampled": False}) == 0.0
+    assert fast_api._traces_sampler(context) == fast_api.sentry_traces_sample_rate
+    assert fast_api._traces_sampler({"transaction_context": {"name": "/health"}, "parent_sampled": True}) == 0.0
+
+
+def _post_pdf(client, output_dir):
+    with open(_PDF_PATH, "rb") as f:
+        return client.post(
+            "/file_parse",
+            files={"files": ("test.pdf", f, "application/pdf")},
+            data={"output_dir": str(output_dir)},
+        )
+
+
+def test_upper_case_suffix_accepted(tmp_path):
+    client = TestClient(fast_api.app)
+    with open(_PDF_PATH, "rb") as f:
+        response = client.post(
+            "/file_parse",
+            files={"files": ("TEST.PDF", f, "application/pdf")},
+            data={"output_dir": str(tmp_path), "return_md": False},
+        )
+    assert response.status_code == 200
+    assert "TEST" in response.json()["results"]
+
+
+def test_request_over_size_limit_rejected(tmp_path):
+    client = TestClient(MaxRequestSizeMiddleware(fast_api.app, max_size=100))
+    response = _post_pdf(client, tmp_path)
+    assert response.status_code == 413
+    assert "exceeds 100 bytes" in response.json()["error"]
+
+
+def test_file_over_size_limit_rejected(monkeypatch, tmp_path):
+    monkeypatch.setattr(fast_api, "MAX_UPLOAD_SIZE", 100)
+    client = TestClient(fast_api.app)
+    response = _post_pdf(client, tmp_path)
+    assert response.status_code == 413
+    assert "test.pdf" in response.json()["error"]
+    assert not any(tmp_path.iterdir())
+
+
+def test_busy_server_returns_429(monkeypatch, tmp_path):
+    monkeypatch.setattr(fast_api, "INFLIGHT", asyncio.Semaphore(0))
+    client = TestClient(fast_api.app)
+    response = _post_pdf(client, tmp_path)
+    assert response.status_code == 429